@@ -5,6 +5,7 @@ import numpy as np
 import requests
 import datetime
 import uuid
+from collections import deque
 import os
 from dotenv import load_dotenv
 from PIL import Image
@@ -12,7 +13,7 @@ import io
 
 import db_handler  # <-- ADD THIS LINE
 import json
-from guardian_dashboard import show_guardian_super_dashboard
+from guardian_dashboard import show_guardian_super_dashboard, set_watering_logs, WATERING_LOG_MAXLEN
 # existing imports from your project
 from community import initialize_community, display_community_feed
 import geopy
@@ -147,7 +148,7 @@ def add_plant_to_garden_safe(plant_data):
 
     # Initialize watering logs for this plant
     if plant['id'] not in st.session_state.watering_logs:
-        st.session_state.watering_logs[plant['id']] = []
+        st.session_state.watering_logs[plant['id']] = deque(maxlen=WATERING_LOG_MAXLEN)
 
     # ✅ FORCE GUARDIAN MODE IMMEDIATELY
     st.session_state.user_state = "GUARDIAN"
@@ -457,7 +458,7 @@ def init_user_session():
             try:
                 user_id = st.session_state.user_id
                 st.session_state.planted_trees = db_handler.load_planted_trees(user_id) or []
-                st.session_state.watering_logs = db_handler.load_watering_logs(user_id) or {}
+                set_watering_logs(db_handler.load_watering_logs(user_id))
             except Exception:
                 pass  # Fail silently, treat as empty garden
         return True
@@ -540,7 +541,7 @@ def init_user_session():
                 st.session_state.user_id = user_id
                 st.session_state.user_profile = existing_data
                 st.session_state.planted_trees = db_handler.load_planted_trees(user_id) or []
-                st.session_state.watering_logs = db_handler.load_watering_logs(user_id) or {}
+                set_watering_logs(db_handler.load_watering_logs(user_id))
                 st.session_state.logged_in = True
 
                 st.success(f"✅ Welcome back, {existing_data.get('username', 'User')}!")
@@ -1092,6 +1093,7 @@ def init_session_state():
         'balcony_direction': 'East',
         'current_page': 'Home',
         'watering_logs': {},
+        'watering_counts': {},
         'plant_photos': {},
         'care_reminders': {},
         'last_aqi': None,
@@ -2103,7 +2105,7 @@ elif st.session_state.current_page == "🛒 Marketplace":
 
     # Import marketplace data
     try:
-        from marketplace_data import get_marketplace_products
+        from marketplace_data import get_marketplace_products, get_products_by_category, get_product_categories
 
         products = get_marketplace_products()
     except ImportError:
@@ -2113,16 +2115,15 @@ elif st.session_state.current_page == "🛒 Marketplace":
 
     if products:
         # Category filter
-        all_categories = list(set([p['category'] for p in products]))
         selected_category = st.selectbox(
             "Filter by category:",
-            ["All Categories"] + sorted(all_categories),
+            ["All Categories"] + get_product_categories(),
             key="marketplace_category_filter"
         )
 
         # Filter products
         if selected_category != "All Categories":
-            filtered_products = [p for p in products if p['category'] == selected_category]
+            filtered_products = get_products_by_category(selected_category)
         else:
             filtered_products = products
 
@@ -2136,18 +2137,18 @@ elif st.session_state.current_page == "🛒 Marketplace":
                     product = filtered_products[i + j]
                     with cols[j]:
                         # Product card
-                        st.markdown(f"### {product['name']}")
-                        st.markdown(f"**Category:** {product['category']}")
-                        st.markdown(f"**Price:** ₹{product['price']}")
-                        st.caption(product['description'])
+                        st.markdown(f"### {product.name}")
+                        st.markdown(f"**Category:** {product.category}")
+                        st.markdown(f"**Price:** ₹{product.price}")
+                        st.caption(product.description)
 
-                        if 'benefits' in product and product['benefits']:
-                            st.markdown(f"*Benefits:* {product['benefits']}")
+                        if product.benefits:
+                            st.markdown(f"*Benefits:* {product.benefits}")
 
                         # Disabled "Add to Cart" button with coming soon message
                         st.button(
                             "🛒 Add to Cart",
-                            key=f"cart_{product['name']}_{i}_{j}",
+                            key=f"cart_{product.name}_{i}_{j}",
                             disabled=True,
                             help="Coming soon! Marketplace under development"
                         )
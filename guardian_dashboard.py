@@ -5,40 +5,145 @@ Guardian Super Dashboard - The Ultimate Plant Care Hub
 
 import streamlit as st
 import datetime
-import plotly.graph_objects as go
+import math
+import re
+from collections import deque
+from functools import lru_cache
 from impact_calculator import calculate_impact
-import numpy as np
-from PIL import Image
-import io
 import db_handler
 
 
+# Lookup tables shared by every plant card
+_HEALTH_EMOJIS = {
+    "Excellent": "✅",
+    "Good": "👍",
+    "Fair": "⚠️",
+    "Needs Attention": "🔴",
+    "Poor": "💀"
+}
+
+_PROGRESS_MAP = {
+    "Newly Planted": 0.15,
+    "Seedling": 0.35,
+    "Sapling": 0.60,
+    "Young Tree": 0.85,
+    "Mature Tree": 1.0
+}
+
+_STATUS_OPTIONS = ("Newly Planted", "Seedling", "Sapling", "Young Tree", "Mature Tree")
+_HEALTH_OPTIONS = ("Excellent", "Good", "Fair", "Needs Attention", "Poor")
+_STATUS_IDX = {status: i for i, status in enumerate(_STATUS_OPTIONS)}
+_HEALTH_IDX = {health: i for i, health in enumerate(_HEALTH_OPTIONS)}
+
+# Name fragments that mark a plant as a balcony plant (needs more frequent watering)
+_BALCONY_RE = re.compile(r'Snake Plant|Tulsi|Mint|Aloe|Spider|Money|Jade|Peace Lily')
+
+# Only the most recent waterings are kept per plant; totals live in watering_counts
+WATERING_LOG_MAXLEN = 100
+
+
 # ===========================
-# PLANT DOCTOR FUNCTIONS
+# SESSION & DATABASE HELPERS
 # ===========================
 
-def analyze_plant_image(img_bytes):
-    """Simple heuristic plant health analysis"""
-    try:
-        img = Image.open(io.BytesIO(img_bytes)).convert("RGB")
-        img_small = img.resize((200, 200))
-        arr = np.array(img_small)
+def _to_iso(event):
+    """Normalize a stored watering event (ISO string, datetime or DB record dict) to an ISO string"""
+    if isinstance(event, dict):
+        return event.get('timestamp')
+    if isinstance(event, datetime.datetime):
+        return event.isoformat()
+    return event
+
+
+def set_watering_logs(logs):
+    """Load watering history into session state as bounded per-plant logs plus counters"""
+    logs = logs or {}
+    # Session logs always hold ISO strings, so readers never branch on the storage format
+    st.session_state.watering_logs = {
+        plant_id: deque((iso for iso in map(_to_iso, events) if iso), maxlen=WATERING_LOG_MAXLEN)
+        for plant_id, events in logs.items()
+    }
+    st.session_state.watering_counts = {plant_id: len(events) for plant_id, events in logs.items()}
+
 
-        r, g, b = arr[:, :, 0].astype(float), arr[:, :, 1].astype(float), arr[:, :, 2].astype(float)
+def _save_to_db(save_fn, *args):
+    """
+    Run a db_handler save for the logged-in user.
 
-        green_mask = (g > r * 1.05) & (g > b * 1.05) & (g > 50)
-        green_ratio = green_mask.sum() / (arr.shape[0] * arr.shape[1])
+    db_handler reports errors itself and returns False, but every caller reruns right
+    after saving, which clears that message; so a failure is also kept in session
+    state and shown by _show_save_error on the next run.
 
-        brown_mask = (r > g * 1.05) & (r > b * 1.05) & (r > 80) & (g < 150)
-        brown_ratio = brown_mask.sum() / (arr.shape[0] * arr.shape[1])
+    Returns:
+        bool: False if the save failed
+    """
+    user_id = st.session_state.get('user_id')
+    if not user_id:
+        return True
+    if not save_fn(user_id, *args):
+        st.session_state.save_error = (
+            "⚠️ Couldn't save to your account - this change is kept for this session only."
+        )
+        return False
+    return True
 
+
+def _show_save_error():
+    """Show a save failure recorded before the last rerun (once)"""
+    message = st.session_state.pop('save_error', None)
+    if message:
+        st.warning(message)
+
+
+# ===========================
+# PLANT DOCTOR FUNCTIONS
+# ===========================
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def analyze_plant_image(img_bytes):
+    """Simple heuristic plant health analysis (cached per photo, so reruns don't rescan it)"""
+    import io
+    import numpy as np
+    from PIL import Image
+
+    try:
+        img = Image.open(io.BytesIO(img_bytes))
+        # For JPEGs, ask libjpeg for a reduced-size DCT decode (1/2 to 1/8 scale,
+        # never below 200 px); other formats ignore this
+        img.draft("RGB", (200, 200))
+        # Then the same filtered 200x200 resize as before: the thresholds (contrast < 30
+        # for "dusty") were tuned on averaged pixels, which plain striding would not give
+        img = img.convert("RGB").resize((200, 200))
+        arr = np.asarray(img)
+
+        # Integer thresholds: g > 1.05 * r  <=>  20 * g > 21 * r, exact for uint8
+        # inputs and free of float temporaries (int16 holds 255 * 21)
+        rgb = arr.astype(np.int16)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        n_pixels = arr.shape[0] * arr.shape[1]
+
+        r20, g20 = r * 20, g * 20
+        r21, g21, b21 = r * 21, g * 21, b * 21
+
+        green_mask = (g20 > r21) & (g20 > b21) & (g > 50)
+        brown_mask = (r20 > g21) & (r20 > b21) & (r > 80) & (g < 150)
         yellow_mask = (r > 150) & (g > 150) & (b < 100)
-        yellow_ratio = yellow_mask.sum() / (arr.shape[0] * arr.shape[1])
 
-        gray = np.mean(arr, axis=2)
-        contrast = gray.std()
-        dusty = contrast < 30
-        brightness = np.mean(gray)
+        # Count all three masks in one reduction
+        green_ratio, brown_ratio, yellow_ratio = np.count_nonzero(
+            np.stack((green_mask, brown_mask, yellow_mask)), axis=(1, 2)
+        ) / n_pixels
+
+        # Brightness/contrast of gray = (R+G+B)/3 from integer sums, without a float gray image:
+        # std(gray) = sqrt(n * sum(s^2) - sum(s)^2) / (3n) with s = R+G+B (0..765, fits int16)
+        gray_sum = rgb.sum(axis=2, dtype=np.int16).ravel()
+        total = int(gray_sum.sum(dtype=np.int64))
+        total_sq = int(np.square(gray_sum, dtype=np.int32).sum(dtype=np.int64))
+        scaled_var = n_pixels * total_sq - total * total  # = (3n)^2 * var(gray)
+        brightness = total / (3 * n_pixels)
+        contrast = math.sqrt(scaled_var) / (3 * n_pixels)
+        # contrast < 30  <=>  scaled_var < (90n)^2, compared exactly in integers
+        dusty = scaled_var < (90 * n_pixels) ** 2
 
         return {
             "green_ratio": float(green_ratio),
@@ -106,75 +211,68 @@ def diagnose_plant_health(analysis):
     return issues, recommendations
 
 
-def calculate_days_since_planted(planted_date_str):
-    """Calculate days since a plant was planted"""
+def calculate_days_since_planted(planted_date_str, today=None):
+    """Calculate days since a plant was planted (date stored as YYYY-MM-DD)"""
     try:
-        planted = datetime.datetime.strptime(planted_date_str, "%Y-%m-%d")
-        today = datetime.datetime.now()
-        delta = today - planted
-        return delta.days
-    except Exception as e:
+        # Fixed format, so slice it directly instead of going through strptime
+        planted = datetime.date(int(planted_date_str[0:4]),
+                                int(planted_date_str[5:7]),
+                                int(planted_date_str[8:10]))
+    except (TypeError, ValueError):
         return 0
+    if today is None:
+        today = datetime.date.today()
+    return (today - planted).days
 
 
 def get_health_emoji(health_status):
     """Return emoji for health status"""
-    health_emojis = {
-        "Excellent": "✅",
-        "Good": "👍",
-        "Fair": "⚠️",
-        "Needs Attention": "🔴",
-        "Poor": "💀"
-    }
-    return health_emojis.get(health_status, "❓")
+    return _HEALTH_EMOJIS.get(health_status, "❓")
 
 
 def get_status_progress(status):
     """Get progress percentage for growth status"""
-    progress_map = {
-        "Newly Planted": 0.15,
-        "Seedling": 0.35,
-        "Sapling": 0.60,
-        "Young Tree": 0.85,
-        "Mature Tree": 1.0
-    }
-    return progress_map.get(status, 0.15)
+    return _PROGRESS_MAP.get(status, 0.15)
 
 
-def suggest_next_action(plant):
+@lru_cache(maxsize=1024)
+def _parse_iso(timestamp):
+    """Parse an ISO timestamp; cached since the same last-watered value recurs every rerun"""
+    return datetime.datetime.fromisoformat(timestamp)
+
+
+@lru_cache(maxsize=1024)
+def _category_for(name):
+    """Classify a plant name; cached per name so the record itself is left untouched"""
+    return 'balcony' if _BALCONY_RE.search(name) else 'outdoor'
+
+
+def get_plant_category(plant):
+    """Return 'balcony' or 'outdoor' for a tracked plant"""
+    return _category_for(plant.get('name', ''))
+
+
+def suggest_next_action(plant, now=None):
     """AI-powered suggestion for next care action"""
     plant_id = plant['id']
+    if now is None:
+        now = datetime.datetime.now()
 
     # Check watering logs
-    logs = st.session_state.watering_logs.get(plant_id, [])
+    logs = st.session_state.watering_logs.get(plant_id)
 
     if not logs:
         return "💧 Water your plant for the first time!"
 
-    # Get last watering
-    last_watered = logs[-1]
-
-    # Handle different storage formats
-    if isinstance(last_watered, dict):
+    # Last watering (logs hold ISO strings, see set_watering_logs)
+    try:
+        days_since = (now - _parse_iso(logs[-1])).days
+    except (TypeError, ValueError):
         return "💧 Water your plant regularly"
-    elif isinstance(last_watered, str):
-        try:
-            last_watered = datetime.datetime.fromisoformat(last_watered)
-            days_since = (datetime.datetime.now() - last_watered).days
-        except:
-            return "💧 Water your plant regularly"
-    else:
-        # It's a datetime object
-        try:
-            days_since = (datetime.datetime.now() - last_watered).days
-        except:
-            return "💧 Water your plant regularly"
 
     # Different plants have different needs
-    plant_name = plant.get('name', '')
-
     # Balcony plants (need frequent watering)
-    if any(x in plant_name for x in ['Snake Plant', 'Tulsi', 'Mint', 'Aloe', 'Spider', 'Money', 'Jade', 'Peace Lily']):
+    if get_plant_category(plant) == 'balcony':
         if days_since >= 3:
             return f"💧 Water needed! Last watered {days_since} days ago"
         elif days_since >= 14:
@@ -192,6 +290,228 @@ def suggest_next_action(plant):
             return "✅ Doing great! Water in a few days"
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_impact_figure(carbon, oxygen):
+    """Build the 10-year projection chart; cached since it only depends on the two totals"""
+    import numpy as np
+    import plotly.graph_objects as go
+
+    # 10-year projection
+    years = np.arange(1, 11)
+    carbon_seq = carbon * np.power(years, 0.8)
+    oxygen_prod = oxygen * np.power(years, 0.7)
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=carbon_seq,
+        mode='lines+markers',
+        name='Carbon Offset (kg)',
+        line=dict(color='#2E7D32', width=3),
+        marker=dict(size=8)
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=oxygen_prod,
+        mode='lines+markers',
+        name='Oxygen Produced (kg)',
+        line=dict(color='#1976D2', width=3),
+        marker=dict(size=8)
+    ))
+
+    fig.update_layout(
+        title='Your Environmental Benefits Over the Next Decade',
+        xaxis_title='Years from Now',
+        yaxis_title='Amount (kg)',
+        hovermode='x unified',
+        template='plotly_white',
+        height=400
+    )
+
+    return fig
+
+
+@st.fragment
+def _render_plant_card(plant, idx):
+    """Render one plant card; its buttons rerun only this card unless the garden changes"""
+    # Read the clock once per card render (fragment reruns reuse their arguments,
+    # so this is taken here rather than passed in)
+    now = datetime.datetime.now()
+
+    # Card-only reruns (watering) don't redraw the page header, so check here too
+    _show_save_error()
+
+    plant_id = plant.get('id', f'plant_{idx}')
+    name = plant.get('name', 'Unknown Plant')
+    status = plant.get('status', 'Newly Planted')
+    health = plant.get('health', 'Good')
+    planted_date = plant.get('planted_date', now.strftime("%Y-%m-%d"))
+
+    days_old = calculate_days_since_planted(planted_date, now.date())
+    progress = get_status_progress(status)
+    next_action = suggest_next_action(plant, now)
+    health_emoji = get_health_emoji(health)
+
+    # Plant card container
+    with st.container():
+        st.markdown(f"#### {name}")
+
+        # Top row: Age + Health
+        col_age, col_health = st.columns(2)
+
+        with col_age:
+            st.metric("🗓 Plant Age", f"{days_old} days")
+
+        with col_health:
+            st.markdown(f"**Health:** {health_emoji}")
+            st.caption(health)
+
+        # Info row: Status + Progress
+        col_info1, col_info2 = st.columns(2)
+
+        with col_info1:
+            st.markdown(f"**Growth Stage:** {status}")
+            st.progress(progress)
+            st.caption(f"🌱 {int(progress * 100)}% to maturity")
+
+        with col_info2:
+            st.markdown(f"**Next Task:**")
+            st.info(next_action)
+
+        # Action row: Buttons + Plant Doctor
+        col_actions, col_doctor = st.columns([1, 2])
+
+        with col_actions:
+            st.markdown("**Quick Actions:**")
+
+            # Watering button
+            if st.button("💧 Log Water", key=f"water_{plant_id}"):
+                # Initialize log if doesn't exist (older sessions stored plain lists)
+                logs = st.session_state.watering_logs.get(plant_id)
+                if not isinstance(logs, deque):
+                    logs = deque(logs or (), maxlen=WATERING_LOG_MAXLEN)
+                    st.session_state.watering_logs[plant_id] = logs
+
+                logs.append(datetime.datetime.now().isoformat())
+                counts = st.session_state.watering_counts
+                counts[plant_id] = counts.get(plant_id, 0) + 1
+
+                # Save to database
+                _save_to_db(db_handler.save_watering_log, plant_id)
+
+                st.success("✅ Watered! +10 XP")
+                st.rerun(scope="fragment")
+
+            # Watering stats
+            water_count = st.session_state.watering_counts.get(plant_id, 0)
+            st.caption(f"✅ Watered {water_count} times total")
+
+            # ✅ FIX #3: REMOVE PLANT BUTTON
+            with st.expander("⚙️ More Options"):
+                st.markdown("**Update Status:**")
+
+                new_status = st.selectbox(
+                    "Growth Stage:",
+                    _STATUS_OPTIONS,
+                    index=_STATUS_IDX.get(status, 0),
+                    key=f"status_update_{plant_id}"
+                )
+
+                new_health = st.selectbox(
+                    "Health:",
+                    _HEALTH_OPTIONS,
+                    index=_HEALTH_IDX.get(health, 0),
+                    key=f"health_update_{plant_id}"
+                )
+
+                col_save, col_remove = st.columns(2)
+
+                with col_save:
+                    if st.button("💾 Save", key=f"save_{plant_id}", use_container_width=True):
+                        plant['status'] = new_status
+                        plant['health'] = new_health
+
+                        # Save to database (a failure is shown after the rerun by _show_save_error)
+                        if _save_to_db(db_handler.save_planted_trees, st.session_state.planted_trees):
+                            st.success("Updated! +20 XP")
+                        # Status feeds the impact metrics and chart, so refresh the whole page
+                        st.rerun()
+
+                with col_remove:
+                    # ✅ NEW: REMOVE BUTTON
+                    if st.button("🗑️ Remove", key=f"remove_{plant_id}", type="secondary",
+                                 use_container_width=True):
+                        st.session_state[f'confirm_remove_{plant_id}'] = True
+                        st.rerun(scope="fragment")
+
+                # ✅ CONFIRMATION DIALOG
+                if st.session_state.get(f'confirm_remove_{plant_id}', False):
+                    st.warning(f"⚠️ Are you sure you want to remove **{name}** from your garden?")
+
+                    col_yes, col_no = st.columns(2)
+
+                    with col_yes:
+                        if st.button("Yes, remove it", key=f"confirm_yes_{plant_id}", type="primary"):
+                            # Remove from session state
+                            st.session_state.planted_trees = [
+                                p for p in st.session_state.planted_trees if p['id'] != plant_id
+                            ]
+
+                            # Remove watering logs
+                            st.session_state.watering_logs.pop(plant_id, None)
+                            st.session_state.watering_counts.pop(plant_id, None)
+
+                            # Update user state if no plants left
+                            if len(st.session_state.planted_trees) == 0:
+                                st.session_state.user_state = "EXPLORER"
+
+                            # Save to database
+                            _save_to_db(db_handler.save_planted_trees, st.session_state.planted_trees)
+
+                            st.success(f"🗑️ {name} removed from garden")
+                            del st.session_state[f'confirm_remove_{plant_id}']
+                            st.rerun()
+
+                    with col_no:
+                        if st.button("No, keep it", key=f"confirm_no_{plant_id}"):
+                            del st.session_state[f'confirm_remove_{plant_id}']
+                            st.rerun(scope="fragment")
+
+        with col_doctor:
+            st.markdown("**🩺 AI Plant Doctor:**")
+
+            photo = st.file_uploader(
+                "Upload photo for health check",
+                type=['jpg', 'png', 'jpeg'],
+                key=f"scan_{plant_id}",
+                help="Take a clear photo of your plant's leaves"
+            )
+
+            if photo:
+                with st.spinner("🔬 Analyzing plant health..."):
+                    img_bytes = photo.getvalue()
+                    st.image(img_bytes, width=200, caption="Analyzing this photo")
+
+                    # Use local functions
+                    analysis = analyze_plant_image(img_bytes)
+                    issues, recommendations = diagnose_plant_health(analysis)
+
+                st.success("✅ Analysis Complete!")
+
+                with st.expander("📋 Full Health Report", expanded=True):
+                    st.markdown("**🔍 Issues Detected:**")
+                    for issue in issues:
+                        st.markdown(f"- {issue}")
+
+                    st.markdown("**💡 Recommendations:**")
+                    for rec in recommendations[:5]:  # Limit to top 5
+                        st.markdown(f"- {rec}")
+
+        st.markdown("---")
+
+
 def show_guardian_super_dashboard():
     """
     THE ULTIMATE DASHBOARD
@@ -207,6 +527,7 @@ def show_guardian_super_dashboard():
 
     st.title("🌿 Your Garden Dashboard")
     st.caption("Guardian Mode • Caring for your plants with science")
+    _show_save_error()
 
     # ============================================
     # SECTION 1: LIVE IMPACT METRICS (Always Visible)
@@ -259,182 +580,7 @@ def show_guardian_super_dashboard():
     else:
         # Display each plant as a card
         for idx, plant in enumerate(st.session_state.planted_trees):
-            plant_id = plant.get('id', f'plant_{idx}')
-            name = plant.get('name', 'Unknown Plant')
-            status = plant.get('status', 'Newly Planted')
-            health = plant.get('health', 'Good')
-            planted_date = plant.get('planted_date', datetime.datetime.now().strftime("%Y-%m-%d"))
-
-            days_old = calculate_days_since_planted(planted_date)
-            progress = get_status_progress(status)
-            next_action = suggest_next_action(plant)
-            health_emoji = get_health_emoji(health)
-
-            # Plant card container
-            with st.container():
-                st.markdown(f"#### {name}")
-
-                # Top row: Age + Health
-                col_age, col_health = st.columns(2)
-
-                with col_age:
-                    st.metric("🗓 Plant Age", f"{days_old} days")
-
-                with col_health:
-                    st.markdown(f"**Health:** {health_emoji}")
-                    st.caption(health)
-
-                # Info row: Status + Progress
-                col_info1, col_info2 = st.columns(2)
-
-                with col_info1:
-                    st.markdown(f"**Growth Stage:** {status}")
-                    st.progress(progress)
-                    st.caption(f"🌱 {int(progress * 100)}% to maturity")
-
-                with col_info2:
-                    st.markdown(f"**Next Task:**")
-                    st.info(next_action)
-
-                # Action row: Buttons + Plant Doctor
-                col_actions, col_doctor = st.columns([1, 2])
-
-                with col_actions:
-                    st.markdown("**Quick Actions:**")
-
-                    # Watering button
-                    if st.button("💧 Log Water", key=f"water_{plant_id}"):
-                        # Initialize log if doesn't exist
-                        if plant_id not in st.session_state.watering_logs:
-                            st.session_state.watering_logs[plant_id] = []
-
-                        st.session_state.watering_logs[plant_id].append(datetime.datetime.now().isoformat())
-
-                        # Save to database
-                        if st.session_state.get('user_id'):
-                            try:
-                                db_handler.save_watering_log(st.session_state.user_id, plant_id)
-                            except:
-                                pass
-
-                        st.success("✅ Watered! +10 XP")
-                        st.rerun()
-
-                    # Watering stats
-                    water_count = len(st.session_state.watering_logs.get(plant_id, []))
-                    st.caption(f"✅ Watered {water_count} times total")
-
-                    # ✅ FIX #3: REMOVE PLANT BUTTON
-                    with st.expander("⚙️ More Options"):
-                        st.markdown("**Update Status:**")
-
-                        new_status = st.selectbox(
-                            "Growth Stage:",
-                            ["Newly Planted", "Seedling", "Sapling", "Young Tree", "Mature Tree"],
-                            index=["Newly Planted", "Seedling", "Sapling", "Young Tree", "Mature Tree"].index(status),
-                            key=f"status_update_{plant_id}"
-                        )
-
-                        new_health = st.selectbox(
-                            "Health:",
-                            ["Excellent", "Good", "Fair", "Needs Attention", "Poor"],
-                            index=["Excellent", "Good", "Fair", "Needs Attention", "Poor"].index(health),
-                            key=f"health_update_{plant_id}"
-                        )
-
-                        col_save, col_remove = st.columns(2)
-
-                        with col_save:
-                            if st.button("💾 Save", key=f"save_{plant_id}", use_container_width=True):
-                                plant['status'] = new_status
-                                plant['health'] = new_health
-
-                                # Save to database
-                                if st.session_state.get('user_id'):
-                                    try:
-                                        db_handler.save_planted_trees(st.session_state.user_id,
-                                                                      st.session_state.planted_trees)
-                                    except:
-                                        pass
-
-                                st.success("Updated! +20 XP")
-                                st.rerun()
-
-                        with col_remove:
-                            # ✅ NEW: REMOVE BUTTON
-                            if st.button("🗑️ Remove", key=f"remove_{plant_id}", type="secondary",
-                                         use_container_width=True):
-                                st.session_state[f'confirm_remove_{plant_id}'] = True
-                                st.rerun()
-
-                        # ✅ CONFIRMATION DIALOG
-                        if st.session_state.get(f'confirm_remove_{plant_id}', False):
-                            st.warning(f"⚠️ Are you sure you want to remove **{name}** from your garden?")
-
-                            col_yes, col_no = st.columns(2)
-
-                            with col_yes:
-                                if st.button("Yes, remove it", key=f"confirm_yes_{plant_id}", type="primary"):
-                                    # Remove from session state
-                                    st.session_state.planted_trees = [
-                                        p for p in st.session_state.planted_trees if p['id'] != plant_id
-                                    ]
-
-                                    # Remove watering logs
-                                    if plant_id in st.session_state.watering_logs:
-                                        del st.session_state.watering_logs[plant_id]
-
-                                    # Update user state if no plants left
-                                    if len(st.session_state.planted_trees) == 0:
-                                        st.session_state.user_state = "EXPLORER"
-
-                                    # Save to database
-                                    try:
-                                        db_handler.save_planted_trees(st.session_state.user_id,
-                                                                      st.session_state.planted_trees)
-                                    except:
-                                        pass
-
-                                    st.success(f"🗑️ {name} removed from garden")
-                                    del st.session_state[f'confirm_remove_{plant_id}']
-                                    st.rerun()
-
-                            with col_no:
-                                if st.button("No, keep it", key=f"confirm_no_{plant_id}"):
-                                    del st.session_state[f'confirm_remove_{plant_id}']
-                                    st.rerun()
-
-                with col_doctor:
-                    st.markdown("**🩺 AI Plant Doctor:**")
-
-                    photo = st.file_uploader(
-                        "Upload photo for health check",
-                        type=['jpg', 'png', 'jpeg'],
-                        key=f"scan_{plant_id}",
-                        help="Take a clear photo of your plant's leaves"
-                    )
-
-                    if photo:
-                        with st.spinner("🔬 Analyzing plant health..."):
-                            img_bytes = photo.getvalue()
-                            st.image(img_bytes, width=200, caption="Analyzing this photo")
-
-                            # Use local functions
-                            analysis = analyze_plant_image(img_bytes)
-                            issues, recommendations = diagnose_plant_health(analysis)
-
-                        st.success("✅ Analysis Complete!")
-
-                        with st.expander("📋 Full Health Report", expanded=True):
-                            st.markdown("**🔍 Issues Detected:**")
-                            for issue in issues:
-                                st.markdown(f"- {issue}")
-
-                            st.markdown("**💡 Recommendations:**")
-                            for rec in recommendations[:5]:  # Limit to top 5
-                                st.markdown(f"- {rec}")
-
-                st.markdown("---")
+            _render_plant_card(plant, idx)
 
     # ============================================
     # SECTION 3: ADD ANOTHER PLANT
@@ -456,40 +602,7 @@ def show_guardian_super_dashboard():
 
     st.markdown("### 📈 Projected Impact Over Time")
 
-    # 10-year projection
-    years = list(range(1, 11))
-    carbon_seq = [impact['carbon_sequestered'] * (year ** 0.8) for year in years]
-    oxygen_prod = [impact['oxygen_produced'] * (year ** 0.7) for year in years]
-
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=carbon_seq,
-        mode='lines+markers',
-        name='Carbon Offset (kg)',
-        line=dict(color='#2E7D32', width=3),
-        marker=dict(size=8)
-    ))
-
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=oxygen_prod,
-        mode='lines+markers',
-        name='Oxygen Produced (kg)',
-        line=dict(color='#1976D2', width=3),
-        marker=dict(size=8)
-    ))
-
-    fig.update_layout(
-        title='Your Environmental Benefits Over the Next Decade',
-        xaxis_title='Years from Now',
-        yaxis_title='Amount (kg)',
-        hovermode='x unified',
-        template='plotly_white',
-        height=400
-    )
-
+    fig = _build_impact_figure(round(impact['carbon_sequestered'], 2), round(impact['oxygen_produced'], 2))
     st.plotly_chart(fig, use_container_width=True)
 
     # ============================================
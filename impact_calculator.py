@@ -1,3 +1,100 @@
+import numpy as np
+
+# Per-species base values: (carbon kg/year, oxygen kg/year, pollutants g/year).
+# These are simplified estimates - real values would depend on species, age, size, etc.
+_SPECIES_VALUES = {
+    # OUTDOOR TREES (Original 12)
+    "Neem": (15.3, 20.7, 135.6),
+    "Banyan": (22.1, 29.8, 187.5),
+    "Arjuna": (16.5, 22.3, 124.8),
+    "Peepal": (21.2, 28.6, 173.4),
+    "Gulmohar": (12.8, 17.3, 95.2),
+    "Ashoka": (10.2, 13.8, 82.6),
+    "Mango": (14.7, 19.8, 108.3),
+    "Amaltas": (11.6, 15.7, 91.4),
+    "Jamun": (13.9, 18.7, 103.7),
+    "Amla": (10.8, 14.6, 87.2),
+    "Silver Oak": (18.4, 24.8, 132.8),
+    "Eucalyptus": (20.6, 27.8, 128.5),
+
+    # OUTDOOR TREES (New additions from tree_data.py)
+    "Guava (Amrood)": (12.5, 16.8, 98.5),
+    "Papaya (Papita)": (10.0, 13.5, 75.0),
+    "Pomegranate (Anar)": (11.0, 14.8, 85.3),
+    "Drumstick (Moringa)": (17.5, 23.6, 142.0),
+    "Curry Tree (Kadi Patta)": (9.0, 12.1, 68.0),
+    "Jackfruit": (28.0, 37.8, 220.0),
+    "Coconut Palm": (32.0, 43.2, 245.0),
+    "Bamboo": (35.0, 47.2, 280.0),
+    "Rain Tree (Samanea)": (24.0, 32.4, 195.0),
+    "Jacaranda": (14.0, 18.9, 112.0),
+    "Bakul (Mimusops)": (13.5, 18.2, 105.0),
+
+    # BALCONY/INDOOR PLANTS (Smaller impact)
+    "Snake Plant (Sansevieria)": (2.0, 2.7, 18.0),
+    "Tulsi (Holy Basil)": (1.5, 2.0, 15.0),
+    "Money Plant (Pothos)": (1.8, 2.4, 22.0),
+    "Aloe Vera": (1.2, 1.6, 12.0),
+    "Mint (Pudina)": (0.8, 1.1, 8.0),
+    "Spider Plant": (1.6, 2.2, 20.0),
+    "Coriander (Dhania)": (0.5, 0.7, 5.0),
+    "Peace Lily": (1.9, 2.6, 25.0),
+    "Tomato (Dwarf Variety)": (1.0, 1.4, 10.0),
+    "Areca Palm": (3.5, 4.7, 30.0),
+    "Curry Leaves (Kadi Patta)": (2.2, 3.0, 16.0),
+    "Jade Plant": (1.1, 1.5, 11.0),
+    "Rubber Plant": (3.0, 4.0, 35.0),
+    "Boston Fern": (1.7, 2.3, 28.0),
+
+    # MEDICINAL PLANTS (New additions)
+    "Lavender": (0.9, 1.2, 9.0),
+    "Rosemary": (1.0, 1.4, 10.0),
+    "Brahmi (Bacopa)": (0.7, 0.9, 7.0),
+    "Ashwagandha (Indian Ginseng)": (1.3, 1.8, 13.0),
+    "Stevia (Sweet Leaf)": (0.8, 1.1, 8.0),
+    "Lemongrass (Hari Chai Patti)": (1.4, 1.9, 14.0),
+    "Ajwain (Carom Plant)": (0.6, 0.8, 6.0),
+    "Methi (Fenugreek)": (0.5, 0.7, 5.0),
+    "Ginger (Adrak)": (1.1, 1.5, 11.0),
+    "Turmeric (Haldi)": (1.2, 1.6, 12.0),
+    "Insulin Plant (Costus)": (1.5, 2.0, 15.0),
+    "Hibiscus (Gudhal)": (2.8, 3.8, 26.0),
+    "English Ivy": (1.6, 2.2, 24.0),
+}
+
+# Alternate display names that share a canonical species row
+_ALIASES = {
+    "Neem (Outdoor)": "Neem",
+    "Gulmohar (Flame Tree)": "Gulmohar",
+}
+
+# Used for species not listed above
+_DEFAULT_VALUES = (5.0, 8.0, 50.0)
+
+# Row lookup: one (N + 1, 3) array with the defaults in the last row.
+# Aliases are folded into the index so a lookup is still a single dict probe.
+_SPECIES_IDX = {name: i for i, name in enumerate(_SPECIES_VALUES)}
+_SPECIES_IDX.update({alias: _SPECIES_IDX[name] for alias, name in _ALIASES.items()})
+_DEFAULT_IDX = len(_SPECIES_VALUES)
+_SPECIES_TABLE = np.array([*_SPECIES_VALUES.values(), _DEFAULT_VALUES], dtype=np.float64)
+
+# Growth factors based on tree stage (unknown stages use 0.5)
+_GROWTH_FACTORS = {
+    "Newly Planted": 0.1,
+    "Seedling": 0.3,
+    "Sapling": 0.5,
+    "Young Tree": 0.8,
+    "Mature Tree": 1.0
+}
+
+# Growth stages as small integer codes (derived from each tree's 'status');
+# _GROWTH_ARR has one extra slot for unknown stages
+GROWTH_STAGES = tuple(_GROWTH_FACTORS)
+_STATUS_CODES = {status: i for i, status in enumerate(GROWTH_STAGES)}
+_UNKNOWN_STATUS_CODE = len(GROWTH_STAGES)
+_GROWTH_ARR = np.array([*_GROWTH_FACTORS.values(), 0.5], dtype=np.float64)
+
+
 def calculate_impact(planted_trees):
     """
     Calculate the environmental impact of planted trees.
@@ -8,33 +105,76 @@ def calculate_impact(planted_trees):
     Returns:
         dict: Environmental impact metrics
     """
-    # Initialize impact metrics
-    carbon_sequestered = 0
-    oxygen_produced = 0
-    pollutants_removed = 0
+    carbon, oxygen, pollutants = calculate_impact_batch(*encode_trees(planted_trees))
+
+    # Return impact data
+    return {
+        "carbon_sequestered": carbon,
+        "oxygen_produced": oxygen,
+        "pollutants_removed": pollutants
+    }
+
+
+def calculate_impact_batch(species_idx, status_idx):
+    """
+    Calculate total impact from pre-encoded trees (see encode_trees).
+
+    Indices are used as-is, so they must come from encode_trees / get_status_code;
+    unknown species and stages are already mapped to the default rows there.
+
+    Args:
+        species_idx (np.ndarray): Species row index per tree
+        status_idx (np.ndarray): Growth status code per tree
+
+    Returns:
+        tuple: (carbon sequestered, oxygen produced, pollutants removed)
+    """
+    # Scale base values by growth stage and sum over trees
+    totals = _GROWTH_ARR[status_idx] @ _SPECIES_TABLE[species_idx]
+    return float(totals[0]), float(totals[1]), float(totals[2])
+
+
+def impact_per_tree(species_idx, status_idx):
+    """
+    Calculate per-tree impact from pre-encoded trees (see encode_trees).
+
+    Args:
+        species_idx (np.ndarray): Species row index per tree
+        status_idx (np.ndarray): Growth status code per tree
+
+    Returns:
+        np.ndarray: (n, 3) array of carbon, oxygen and pollutants per tree
+    """
+    return _SPECIES_TABLE[species_idx] * _GROWTH_ARR[status_idx][:, np.newaxis]
+
 
-    # Calculate impact for each tree
+def _records(planted_trees):
+    """Yield (species row index, growth status code) for each tree"""
     for tree in planted_trees:
-        # Base values per tree (kg per year)
-        # These are simplified estimates - real values would depend on species, age, size, etc.
-        base_carbon = get_base_carbon(tree['name'])
-        base_oxygen = get_base_oxygen(tree['name'])
-        base_pollutants = get_base_pollutants(tree['name'])
+        status_code = _STATUS_CODES.get(tree.get('status', 'Newly Planted'), _UNKNOWN_STATUS_CODE)
+        yield _SPECIES_IDX.get(tree['name'], _DEFAULT_IDX), status_code
 
-        # Adjust based on tree status/growth stage
-        growth_factor = get_growth_factor(tree.get('status', 'Newly Planted'))
 
-        # Add to total impact
-        carbon_sequestered += base_carbon * growth_factor
-        oxygen_produced += base_oxygen * growth_factor
-        pollutants_removed += base_pollutants * growth_factor
+def encode_trees(planted_trees):
+    """
+    Convert tree records into parallel index arrays (structure of arrays).
 
-    # Return impact data
-    return {
-        "carbon_sequestered": carbon_sequestered,
-        "oxygen_produced": oxygen_produced,
-        "pollutants_removed": pollutants_removed
-    }
+    Args:
+        planted_trees (iterable): Tracked trees (a list or tuple is used as-is,
+            other iterables such as generators are collected into a list first)
+
+    Returns:
+        tuple: (species row indices, growth status codes) as intp arrays
+    """
+    # np.fromiter needs the count up front
+    if not isinstance(planted_trees, (list, tuple)):
+        planted_trees = list(planted_trees)
+
+    # Single pass over the dicts, filling an (n, 2) index array row by row
+    pairs = np.fromiter(
+        _records(planted_trees), dtype=np.dtype((np.intp, 2)), count=len(planted_trees)
+    )
+    return pairs[:, 0], pairs[:, 1]
 
 
 def get_base_carbon(tree_name):
@@ -47,71 +187,7 @@ def get_base_carbon(tree_name):
     Returns:
         float: Base carbon sequestration value
     """
-    # These values are simplified estimates
-    carbon_values = {
-        # OUTDOOR TREES (Original 12)
-        "Neem": 15.3,
-        "Banyan": 22.1,
-        "Arjuna": 16.5,
-        "Peepal": 21.2,
-        "Gulmohar": 12.8,
-        "Ashoka": 10.2,
-        "Mango": 14.7,
-        "Amaltas": 11.6,
-        "Jamun": 13.9,
-        "Amla": 10.8,
-        "Silver Oak": 18.4,
-        "Eucalyptus": 20.6,
-
-        # OUTDOOR TREES (New additions from tree_data.py)
-        "Guava (Amrood)": 12.5,
-        "Papaya (Papita)": 10.0,
-        "Pomegranate (Anar)": 11.0,
-        "Drumstick (Moringa)": 17.5,
-        "Curry Tree (Kadi Patta)": 9.0,
-        "Jackfruit": 28.0,
-        "Coconut Palm": 32.0,
-        "Neem (Outdoor)": 15.3,
-        "Bamboo": 35.0,
-        "Rain Tree (Samanea)": 24.0,
-        "Gulmohar (Flame Tree)": 12.8,
-        "Jacaranda": 14.0,
-        "Bakul (Mimusops)": 13.5,
-
-        # BALCONY/INDOOR PLANTS (Smaller carbon impact)
-        "Snake Plant (Sansevieria)": 2.0,
-        "Tulsi (Holy Basil)": 1.5,
-        "Money Plant (Pothos)": 1.8,
-        "Aloe Vera": 1.2,
-        "Mint (Pudina)": 0.8,
-        "Spider Plant": 1.6,
-        "Coriander (Dhania)": 0.5,
-        "Peace Lily": 1.9,
-        "Tomato (Dwarf Variety)": 1.0,
-        "Areca Palm": 3.5,
-        "Curry Leaves (Kadi Patta)": 2.2,
-        "Jade Plant": 1.1,
-        "Rubber Plant": 3.0,
-        "Boston Fern": 1.7,
-
-        # MEDICINAL PLANTS (New additions)
-        "Lavender": 0.9,
-        "Rosemary": 1.0,
-        "Brahmi (Bacopa)": 0.7,
-        "Ashwagandha (Indian Ginseng)": 1.3,
-        "Stevia (Sweet Leaf)": 0.8,
-        "Lemongrass (Hari Chai Patti)": 1.4,
-        "Ajwain (Carom Plant)": 0.6,
-        "Methi (Fenugreek)": 0.5,
-        "Ginger (Adrak)": 1.1,
-        "Turmeric (Haldi)": 1.2,
-        "Insulin Plant (Costus)": 1.5,
-        "Hibiscus (Gudhal)": 2.8,
-        "English Ivy": 1.6,
-    }
-
-    # Return value for the tree or default value if not found
-    return carbon_values.get(tree_name, 5.0)
+    return float(_SPECIES_TABLE[_SPECIES_IDX.get(tree_name, _DEFAULT_IDX), 0])
 
 
 def get_base_oxygen(tree_name):
@@ -124,71 +200,7 @@ def get_base_oxygen(tree_name):
     Returns:
         float: Base oxygen production value
     """
-    # These values are simplified estimates
-    oxygen_values = {
-        # OUTDOOR TREES (Original 12)
-        "Neem": 20.7,
-        "Banyan": 29.8,
-        "Arjuna": 22.3,
-        "Peepal": 28.6,
-        "Gulmohar": 17.3,
-        "Ashoka": 13.8,
-        "Mango": 19.8,
-        "Amaltas": 15.7,
-        "Jamun": 18.7,
-        "Amla": 14.6,
-        "Silver Oak": 24.8,
-        "Eucalyptus": 27.8,
-
-        # OUTDOOR TREES (New additions)
-        "Guava (Amrood)": 16.8,
-        "Papaya (Papita)": 13.5,
-        "Pomegranate (Anar)": 14.8,
-        "Drumstick (Moringa)": 23.6,
-        "Curry Tree (Kadi Patta)": 12.1,
-        "Jackfruit": 37.8,
-        "Coconut Palm": 43.2,
-        "Neem (Outdoor)": 20.7,
-        "Bamboo": 47.2,
-        "Rain Tree (Samanea)": 32.4,
-        "Gulmohar (Flame Tree)": 17.3,
-        "Jacaranda": 18.9,
-        "Bakul (Mimusops)": 18.2,
-
-        # BALCONY/INDOOR PLANTS
-        "Snake Plant (Sansevieria)": 2.7,
-        "Tulsi (Holy Basil)": 2.0,
-        "Money Plant (Pothos)": 2.4,
-        "Aloe Vera": 1.6,
-        "Mint (Pudina)": 1.1,
-        "Spider Plant": 2.2,
-        "Coriander (Dhania)": 0.7,
-        "Peace Lily": 2.6,
-        "Tomato (Dwarf Variety)": 1.4,
-        "Areca Palm": 4.7,
-        "Curry Leaves (Kadi Patta)": 3.0,
-        "Jade Plant": 1.5,
-        "Rubber Plant": 4.0,
-        "Boston Fern": 2.3,
-
-        # MEDICINAL PLANTS
-        "Lavender": 1.2,
-        "Rosemary": 1.4,
-        "Brahmi (Bacopa)": 0.9,
-        "Ashwagandha (Indian Ginseng)": 1.8,
-        "Stevia (Sweet Leaf)": 1.1,
-        "Lemongrass (Hari Chai Patti)": 1.9,
-        "Ajwain (Carom Plant)": 0.8,
-        "Methi (Fenugreek)": 0.7,
-        "Ginger (Adrak)": 1.5,
-        "Turmeric (Haldi)": 1.6,
-        "Insulin Plant (Costus)": 2.0,
-        "Hibiscus (Gudhal)": 3.8,
-        "English Ivy": 2.2,
-    }
-
-    # Return value for the tree or default value if not found
-    return oxygen_values.get(tree_name, 8.0)
+    return float(_SPECIES_TABLE[_SPECIES_IDX.get(tree_name, _DEFAULT_IDX), 1])
 
 
 def get_base_pollutants(tree_name):
@@ -201,71 +213,7 @@ def get_base_pollutants(tree_name):
     Returns:
         float: Base pollutant removal value
     """
-    # These values are simplified estimates
-    pollutant_values = {
-        # OUTDOOR TREES (Original 12)
-        "Neem": 135.6,
-        "Banyan": 187.5,
-        "Arjuna": 124.8,
-        "Peepal": 173.4,
-        "Gulmohar": 95.2,
-        "Ashoka": 82.6,
-        "Mango": 108.3,
-        "Amaltas": 91.4,
-        "Jamun": 103.7,
-        "Amla": 87.2,
-        "Silver Oak": 132.8,
-        "Eucalyptus": 128.5,
-
-        # OUTDOOR TREES (New additions)
-        "Guava (Amrood)": 98.5,
-        "Papaya (Papita)": 75.0,
-        "Pomegranate (Anar)": 85.3,
-        "Drumstick (Moringa)": 142.0,
-        "Curry Tree (Kadi Patta)": 68.0,
-        "Jackfruit": 220.0,
-        "Coconut Palm": 245.0,
-        "Neem (Outdoor)": 135.6,
-        "Bamboo": 280.0,
-        "Rain Tree (Samanea)": 195.0,
-        "Gulmohar (Flame Tree)": 95.2,
-        "Jacaranda": 112.0,
-        "Bakul (Mimusops)": 105.0,
-
-        # BALCONY/INDOOR PLANTS (Lower but still significant)
-        "Snake Plant (Sansevieria)": 18.0,
-        "Tulsi (Holy Basil)": 15.0,
-        "Money Plant (Pothos)": 22.0,
-        "Aloe Vera": 12.0,
-        "Mint (Pudina)": 8.0,
-        "Spider Plant": 20.0,
-        "Coriander (Dhania)": 5.0,
-        "Peace Lily": 25.0,
-        "Tomato (Dwarf Variety)": 10.0,
-        "Areca Palm": 30.0,
-        "Curry Leaves (Kadi Patta)": 16.0,
-        "Jade Plant": 11.0,
-        "Rubber Plant": 35.0,
-        "Boston Fern": 28.0,
-
-        # MEDICINAL PLANTS
-        "Lavender": 9.0,
-        "Rosemary": 10.0,
-        "Brahmi (Bacopa)": 7.0,
-        "Ashwagandha (Indian Ginseng)": 13.0,
-        "Stevia (Sweet Leaf)": 8.0,
-        "Lemongrass (Hari Chai Patti)": 14.0,
-        "Ajwain (Carom Plant)": 6.0,
-        "Methi (Fenugreek)": 5.0,
-        "Ginger (Adrak)": 11.0,
-        "Turmeric (Haldi)": 12.0,
-        "Insulin Plant (Costus)": 15.0,
-        "Hibiscus (Gudhal)": 26.0,
-        "English Ivy": 24.0,
-    }
-
-    # Return value for the tree or default value if not found
-    return pollutant_values.get(tree_name, 50.0)
+    return float(_SPECIES_TABLE[_SPECIES_IDX.get(tree_name, _DEFAULT_IDX), 2])
 
 
 def get_growth_factor(status):
@@ -278,14 +226,17 @@ def get_growth_factor(status):
     Returns:
         float: Growth factor multiplier
     """
-    # Growth factors based on tree stage
-    factors = {
-        "Newly Planted": 0.1,
-        "Seedling": 0.3,
-        "Sapling": 0.5,
-        "Young Tree": 0.8,
-        "Mature Tree": 1.0
-    }
+    return _GROWTH_FACTORS.get(status, 0.5)
+
 
-    # Return factor for the status or default factor if not found
-    return factors.get(status, 0.5)
\ No newline at end of file
+def get_status_code(status):
+    """
+    Get the integer code for a growth stage.
+
+    Args:
+        status (str): Growth stage of the tree
+
+    Returns:
+        int: Index into GROWTH_STAGES, or the unknown-stage code
+    """
+    return _STATUS_CODES.get(status, _UNKNOWN_STATUS_CODE)
@@ -1,36 +1,96 @@
-import pandas as pd
-from tree_data import get_tree_data
+import heapq
+from functools import lru_cache
+from operator import itemgetter
 
+from tree_data import get_trees_by_climate, get_trees_by_soil, SUN_LOW, SUN_MEDIUM, SUN_HIGH
 
-def get_recommendations(climate_data, soil_data):
+# Score bonuses by tree attribute, applied in dry (< 800 mm) and wet (> 1500 mm) areas
+_DROUGHT_TOLERANCE_BONUS = {"High": 3, "Medium": 1}
+_WATER_NEEDS_BONUS = {"High": 2, "Medium": 1}
+
+# Sunlight levels a plant may need for the hours available: < 4, 4-6, 6-8, otherwise 8+
+_SUN_BUCKETS = ((4, SUN_LOW), (6, SUN_LOW | SUN_MEDIUM), (8, SUN_MEDIUM | SUN_HIGH))
+
+# Sort key for (score, record) pairs
+_by_score = itemgetter(0)
+
+# Balcony space option -> plant space_required values that fit it
+_SPACE_MAP = {
+    "Very Small (≤ 0.5 m²)": frozenset({"Very Small"}),
+    "Small (0.5-2 m²)": frozenset({"Small"}),
+    "Medium (2-5 m²)": frozenset({"Small", "Medium"}),
+    "Large (>5 m²)": frozenset({"Small", "Medium", "Large"})
+}
+_DEFAULT_SPACES = frozenset({"Small"})
+
+
+def _sunlight_levels(sunlight_hours):
+    """Bitmask of the sunlight levels suited to a number of daily sun hours"""
+    for upper, levels in _SUN_BUCKETS:
+        if sunlight_hours < upper:
+            return levels
+    return SUN_HIGH
+
+
+def get_recommendations(climate_data, soil_data, top_k=None):
     """
     Generates tree recommendations based on climate and soil data.
 
     Args:
         climate_data (dict): Climate data for the location
         soil_data (dict): Soil data for the location
+        top_k (int, optional): Return only the best top_k scored trees (all by default)
 
     Returns:
         list: List of recommended tree species
     """
-    # Get all available trees
-    all_trees = get_tree_data()
+    # Scoring only depends on these, so rankings are cached per combination.
+    # Rainfall is optional here: the soil fallback below never needed it
+    rainfall = climate_data.get("annual_rainfall")
+    ranked_trees = _rank_trees(
+        climate_data["climate_zone"],
+        soil_data["soil_type"],
+        rainfall is not None and rainfall < 800,  # Low rainfall
+        rainfall is not None and rainfall > 1500,  # High rainfall
+        climate_data.get("pollution_level") == "High"
+    )
 
-    # Filter trees based on climate suitability
-    climate_suitable_trees = []
-    for tree in all_trees:
-        if climate_data["climate_zone"] in tree["climate_suitability"]:
-            climate_suitable_trees.append(tree)
+    # If we have too few recommendations, relax soil constraints
+    if ranked_trees is None:
+        return list(get_trees_by_climate(climate_data["climate_zone"]))
 
-    # Further filter based on soil suitability
-    soil_suitable_trees = []
-    for tree in climate_suitable_trees:
-        if soil_data["soil_type"] in tree["soil_suitability"]:
-            soil_suitable_trees.append(tree)
+    if top_k is not None:
+        ranked_trees = ranked_trees[:top_k]
+
+    # Copy only the returned trees (the records are shared) and attach their score
+    return [{**tree, "recommendation_score": score} for score, tree in ranked_trees]
+
+
+@lru_cache(maxsize=256)
+def _rank_trees(climate_zone, soil_type, dry, wet, pollution_high):
+    """
+    Scores the trees suited to a climate zone and soil type.
+
+    Args:
+        climate_zone (str): Climate zone of the location
+        soil_type (str): Soil type of the location
+        dry (bool): Annual rainfall below 800 mm
+        wet (bool): Annual rainfall above 1500 mm
+        pollution_high (bool): Pollution level is "High"
+
+    Returns:
+        tuple: (score, tree) pairs, best first (ties in dataset order), or None
+            when fewer than 3 trees suit the soil
+    """
+    # Filter trees based on climate suitability (precomputed index)
+    climate_suitable_trees = get_trees_by_climate(climate_zone)
+
+    # Further filter based on soil suitability, keeping dataset order
+    soil_suitable_ids = {id(tree) for tree in get_trees_by_soil(soil_type)}
+    soil_suitable_trees = [tree for tree in climate_suitable_trees if id(tree) in soil_suitable_ids]
 
-    # If we have too few recommendations, relax soil constraints
     if len(soil_suitable_trees) < 3:
-        return climate_suitable_trees
+        return None
 
     # Score each tree based on environmental conditions
     scored_trees = []
@@ -38,88 +98,66 @@ def get_recommendations(climate_data, soil_data):
         score = 0
 
         # Score based on drought tolerance if in dry area
-        if climate_data["annual_rainfall"] < 800:  # Low rainfall
-            if tree["drought_tolerance"] == "High":
-                score += 3
-            elif tree["drought_tolerance"] == "Medium":
-                score += 1
+        if dry:
+            score += _DROUGHT_TOLERANCE_BONUS.get(tree.get("drought_tolerance"), 0)
 
         # Score based on water needs if in wet area
-        if climate_data["annual_rainfall"] > 1500:  # High rainfall
-            if tree["water_needs"] == "High":
-                score += 2
-            elif tree["water_needs"] == "Medium":
-                score += 1
+        if wet:
+            score += _WATER_NEEDS_BONUS.get(tree.get("water_needs"), 0)
 
         # Score based on pollution levels (if available)
-        if "pollution_level" in climate_data:
-            if climate_data["pollution_level"] == "High" and "Air Purification" in tree["purposes"]:
-                score += 3
+        if pollution_high and "Air Purification" in tree["purposes"]:
+            score += 3
 
-        # Add the scored tree
-        tree_with_score = tree.copy()
-        tree_with_score["recommendation_score"] = score
-        scored_trees.append(tree_with_score)
+        scored_trees.append((score, tree))
 
-    # Sort trees by score
-    sorted_trees = sorted(scored_trees, key=lambda x: x["recommendation_score"], reverse=True)
-
-    # Return top recommendations
-    return sorted_trees
+    # Stable sort, so a top_k slice matches heapq.nlargest
+    return tuple(sorted(scored_trees, key=_by_score, reverse=True))
 
 
 def get_balcony_recommendations(space_size, sunlight_hours, purposes, climate_data=None):
     """
     Returns plant recommendations for balcony/urban spaces
     """
-    from tree_data import get_balcony_plants_data
+    from tree_data import (
+        get_balcony_plants_data,
+        get_balcony_purpose_masks,
+        get_balcony_sunlight_masks,
+        purposes_mask
+    )
 
     all_plants = get_balcony_plants_data()
+    wanted_purposes = purposes_mask(purposes) if purposes else 0
+    sunlight_levels = _sunlight_levels(sunlight_hours)
     recommendations = []
 
     # Filter by space
-    space_map = {
-        "Very Small (≤ 0.5 m²)": "Very Small",
-        "Small (0.5-2 m²)": "Small",
-        "Medium (2-5 m²)": ["Small", "Medium"],
-        "Large (>5 m²)": ["Small", "Medium", "Large"]
-    }
-
-    allowed_spaces = space_map.get(space_size, ["Small"])
-    if isinstance(allowed_spaces, str):
-        allowed_spaces = [allowed_spaces]
-
-    for plant in all_plants:
+    allowed_spaces = _SPACE_MAP.get(space_size, _DEFAULT_SPACES)
+
+    for plant, plant_purposes, plant_sunlight in zip(
+            all_plants, get_balcony_purpose_masks(), get_balcony_sunlight_masks()):
         if plant['space_required'] not in allowed_spaces:
             continue
 
-        # Filter by sunlight
-        if sunlight_hours < 4 and "Low" not in plant['sunlight_need']:
+        # Filter by sunlight (plant needs at least one level the spot provides)
+        if not plant_sunlight & sunlight_levels:
+            continue
+
+        # Filter by purpose (one bit per purpose)
+        matching_purposes = (plant_purposes & wanted_purposes).bit_count()
+        if purposes and not matching_purposes:
             continue
-        if sunlight_hours >= 6 and "High" not in plant['sunlight_need']:
-            if sunlight_hours < 8:  # Medium sunlight OK for high-need plants
-                pass
-            else:
-                continue
-
-        # Filter by purpose
-        if purposes:
-            if any(purpose in plant['purposes'] for purpose in purposes):
-                recommendations.append(plant)
-        else:
-            recommendations.append(plant)
-
-    # Add suitability score
-    for plant in recommendations:
+        recommendations.append((plant, matching_purposes))
+
+    # Score each plant
+    scored_plants = []
+    for plant, matching_purposes in recommendations:
         score = 0
         if plant['care_difficulty'] in ['Very Easy', 'Easy']:
             score += 2
-        if purposes:
-            matching_purposes = sum(1 for p in purposes if p in plant['purposes'])
-            score += matching_purposes * 3
-        plant['suitability_score'] = score
-
-    # Sort by suitability
-    recommendations.sort(key=lambda x: x['suitability_score'], reverse=True)
+        score += matching_purposes * 3
+        scored_plants.append((score, plant))
 
-    return recommendations[:9]  # Return top 9
\ No newline at end of file
+    # Return the top 9 by suitability, copied (the plant records are shared)
+    top_plants = heapq.nlargest(9, scored_plants, key=_by_score)
+    return [{**plant, 'suitability_score': score} for score, plant in top_plants]
\ No newline at end of file
@@ -1,12 +1,35 @@
-import pandas as pd
 import random
+from functools import lru_cache
+from types import MappingProxyType
 
+# Soil type -> (drainage, nutrient level, pH low, pH high) for simulated soil data
+_SOIL_PROFILES = {
+    "Sandy": ("Excellent", "Low", 5.5, 7.0),
+    "Loamy": ("Good", "High", 6.0, 7.5),
+    "Clay": ("Poor", "High", 6.0, 7.5),
+    "Silty": ("Moderate", "Medium", 6.0, 7.0),
+    "Rocky": ("Excellent", "Low", 5.5, 7.0),
+    "Riverbed": ("Good", "High", 6.0, 7.0)
+}
+_SOIL_OPTIONS = tuple(_SOIL_PROFILES)
+
+_TEXTURES = {
+    "Sandy": "Gritty with large particles",
+    "Loamy": "Crumbly with medium-sized particles",
+    "Clay": "Sticky when wet, hard when dry",
+    "Silty": "Smooth and flour-like when dry",
+    "Rocky": "Contains stones and little fine material",
+    "Riverbed": "Mixed texture with sand and silt"
+}
+
+
+@lru_cache(maxsize=1)
 def get_soil_types():
     """
     Returns a list of soil types and their characteristics.
     
     Returns:
-        list: List of soil types with details
+        tuple: Soil types with details (built once and shared; do not modify)
     """
     soil_types = [
         {
@@ -53,7 +76,7 @@ def get_soil_types():
         }
     ]
     
-    return soil_types
+    return tuple(soil_types)
 
 def get_soil_data(lat, lon):
     """
@@ -69,47 +92,27 @@ def get_soil_data(lat, lon):
     """
     # In a real implementation, we would use an appropriate soil database or API
     # For this example, we'll generate simulated data based on the coordinates
-    
-    # Pseudo-random selection based on coordinates
-    soil_options = ["Sandy", "Loamy", "Clay", "Silty", "Rocky", "Riverbed"]
-    drainage_options = ["Poor", "Moderate", "Good", "Excellent"]
-    nutrient_options = ["Low", "Medium", "High"]
-    
-    # Use coordinates to seed random selection
+
+    # Use coordinates to seed random selection; results only depend on this seed,
+    # so they are cached per seed and the caller gets its own copy
     # This is just for demonstration - in a real app, use actual soil data services
     seed = int(abs(lat * 100 + lon * 100))
-    random.seed(seed)
-    
-    soil_type = random.choice(soil_options)
-    
-    # Assign related properties based on soil type
-    if soil_type == "Sandy":
-        drainage = "Excellent"
-        nutrient_level = "Low"
-    elif soil_type == "Loamy":
-        drainage = "Good"
-        nutrient_level = "High"
-    elif soil_type == "Clay":
-        drainage = "Poor"
-        nutrient_level = "High"
-    elif soil_type == "Silty":
-        drainage = "Moderate"
-        nutrient_level = "Medium"
-    elif soil_type == "Rocky":
-        drainage = "Excellent"
-        nutrient_level = "Low"
-    else:  # Riverbed
-        drainage = "Good"
-        nutrient_level = "High"
-    
+    return dict(_soil_data_for_seed(seed))
+
+
+@lru_cache(maxsize=4096)
+def _soil_data_for_seed(seed):
+    """Simulated soil data for one coordinate seed (cached, read-only)"""
+    # Local generator: same sequence as seeding the module, without touching global state
+    rng = random.Random(seed)
+
+    # Pseudo-random soil type; related properties and pH range come from its profile
+    soil_type = rng.choice(_SOIL_OPTIONS)
+    drainage, nutrient_level, ph_low, ph_high = _SOIL_PROFILES[soil_type]
+
     # Randomize pH level but keep it realistic
-    if soil_type in ["Sandy", "Rocky"]:
-        ph_level = round(random.uniform(5.5, 7.0), 1)
-    elif soil_type in ["Clay", "Loamy"]:
-        ph_level = round(random.uniform(6.0, 7.5), 1)
-    else:
-        ph_level = round(random.uniform(6.0, 7.0), 1)
-    
+    ph_level = round(rng.uniform(ph_low, ph_high), 1)
+
     # Create soil data dictionary
     soil_data = {
         "soil_type": soil_type,
@@ -119,7 +122,7 @@ def get_soil_data(lat, lon):
         "texture": get_soil_texture(soil_type)
     }
     
-    return soil_data
+    return MappingProxyType(soil_data)
 
 def get_soil_texture(soil_type):
     """
@@ -131,13 +134,4 @@ def get_soil_texture(soil_type):
     Returns:
         str: Description of soil texture
     """
-    textures = {
-        "Sandy": "Gritty with large particles",
-        "Loamy": "Crumbly with medium-sized particles",
-        "Clay": "Sticky when wet, hard when dry",
-        "Silty": "Smooth and flour-like when dry",
-        "Rocky": "Contains stones and little fine material",
-        "Riverbed": "Mixed texture with sand and silt"
-    }
-    
-    return textures.get(soil_type, "Unknown texture")
+    return _TEXTURES.get(soil_type, "Unknown texture")
@@ -1,9 +1,17 @@
-import pandas as pd
+from functools import lru_cache
 
+# Sunlight levels as bits, matched against the level names in 'sunlight_need'
+SUN_LOW, SUN_MEDIUM, SUN_HIGH = 1, 2, 4
+_SUN_LEVELS = (("Low", SUN_LOW), ("Medium", SUN_MEDIUM), ("High", SUN_HIGH))
+
+
+@lru_cache(maxsize=1)
 def get_tree_data():
     """
     Returns a dataset of tree species with their characteristics and suitability factors.
     In a production environment, this would be fetched from a database.
+
+    Built once and shared between callers: copy a tree before changing it.
     """
     trees = [
         {
@@ -431,7 +439,7 @@ def get_tree_data():
         },
     ]
     
-    return trees
+    return tuple(trees)
 
 
 def get_tree_details(tree_name):
@@ -444,15 +452,62 @@ def get_tree_details(tree_name):
     Returns:
         dict: Tree details or None if not found
     """
-    trees = get_tree_data()
-    for tree in trees:
-        if tree["name"].lower() == tree_name.lower():
-            return tree
-    return None
+    return _trees_by_name().get(tree_name.lower())
+
+
+@lru_cache(maxsize=1)
+def _trees_by_name():
+    """Lower-cased tree name -> tree (first one wins, as with a linear scan)"""
+    by_name = {}
+    for tree in get_tree_data():
+        by_name.setdefault(tree["name"].lower(), tree)
+    return by_name
+
+
+@lru_cache(maxsize=1)
+def _suitability_index():
+    """(climate zone -> trees, soil type -> trees), built once from get_tree_data()"""
+    by_climate, by_soil = {}, {}
+    for tree in get_tree_data():
+        for zone in tree["climate_suitability"]:
+            by_climate.setdefault(zone, []).append(tree)
+        for soil in tree["soil_suitability"]:
+            by_soil.setdefault(soil, []).append(tree)
+    return (
+        {zone: tuple(trees) for zone, trees in by_climate.items()},
+        {soil: tuple(trees) for soil, trees in by_soil.items()},
+    )
+
+
+def get_trees_by_climate(climate_zone):
+    """
+    Returns the trees suited to a climate zone.
+
+    Args:
+        climate_zone (str): Climate zone, e.g. "Tropical"
+
+    Returns:
+        tuple: Tree records (shared) in dataset order
+    """
+    return _suitability_index()[0].get(climate_zone, ())
+
+
+def get_trees_by_soil(soil_type):
+    """
+    Returns the trees suited to a soil type.
+
+    Args:
+        soil_type (str): Soil type, e.g. "Loamy"
+
+    Returns:
+        tuple: Tree records (shared) in dataset order
+    """
+    return _suitability_index()[1].get(soil_type, ())
 
 # tree_data.py — include your existing get_tree_data() list (keep it), and ensure this function exists:
+@lru_cache(maxsize=1)
 def get_balcony_plants_data():
-    """Returns dataset of balcony-friendly plants"""
+    """Returns dataset of balcony-friendly plants (built once and shared: copy before changing)"""
     balcony_plants = [
         {
             'name': 'Snake Plant (Sansevieria)',
@@ -1028,4 +1083,45 @@ def get_balcony_plants_data():
             'indoor_ok': True
         },
     ]
-    return balcony_plants
\ No newline at end of file
+    return tuple(balcony_plants)
+
+
+@lru_cache(maxsize=1)
+def _purpose_bits():
+    """Purpose -> bit, for every purpose used in the tree and balcony datasets"""
+    all_purposes = dict.fromkeys(
+        purpose for plant in (*get_tree_data(), *get_balcony_plants_data()) for purpose in plant['purposes']
+    )
+    return {purpose: 1 << i for i, purpose in enumerate(all_purposes)}
+
+
+def purposes_mask(purposes):
+    """
+    Encodes a list of purposes as a bitmask.
+
+    Args:
+        purposes (list): Purpose names, e.g. ["Air Purification", "Edible"]
+
+    Returns:
+        int: One bit per known purpose (purposes no plant has are ignored)
+    """
+    bits = _purpose_bits()
+    mask = 0
+    for purpose in purposes:
+        mask |= bits.get(purpose, 0)
+    return mask
+
+
+@lru_cache(maxsize=1)
+def get_balcony_purpose_masks():
+    """Purpose bitmask per balcony plant, parallel to get_balcony_plants_data()"""
+    return tuple(purposes_mask(plant['purposes']) for plant in get_balcony_plants_data())
+
+
+@lru_cache(maxsize=1)
+def get_balcony_sunlight_masks():
+    """Sunlight level bits per balcony plant ("Medium to High" -> SUN_MEDIUM | SUN_HIGH)"""
+    return tuple(
+        sum(bit for level, bit in _SUN_LEVELS if level in plant['sunlight_need'])
+        for plant in get_balcony_plants_data()
+    )
\ No newline at end of file
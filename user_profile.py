@@ -2,188 +2,272 @@
 User Profile and Gamification System
 """
 import streamlit as st
-from datetime import datetime
+from datetime import date
+
+# Green score bonuses per plant
+_HEALTH_BONUS = {
+    'Excellent': 5,
+    'Good': 3,
+    'Fair': 1,
+    'Needs Attention': 0,
+    'Poor': -2
+}
+_STATUS_BONUS = {
+    'Newly Planted': 0,
+    'Seedling': 2,
+    'Sapling': 5,
+    'Young Tree': 10,
+    'Mature Tree': 20
+}
+
+# Total XP needed to leave level n is n * _XP_PER_LEVEL (XP is never spent)
+_XP_PER_LEVEL = 500
+
+# (minimum level, rank title), highest first
+_RANKS = (
+    (15, "🌍 Planet Protector"),
+    (10, "🏞️ Eco Warrior"),
+    (7, "🌲 Forest Keeper"),
+    (5, "🌳 Tree Guardian"),
+    (3, "🪴 Gardener"),
+    (2, "🌿 Sprout"),
+    (1, "🌱 Seedling")
+)
 
 
 def initialize_user_profile():
     """Initialize user profile in session state"""
     if 'user_profile' not in st.session_state:
+        today = date.today().isoformat()
         st.session_state.user_profile = {
             'username': 'Green Enthusiast',
             'level': 1,
             'xp': 0,
             'green_score': 0,
             'trees_planted': 0,
-            'join_date': datetime.now().strftime("%Y-%m-%d"),
+            'join_date': today,
             'streak_days': 0,
-            'last_active_date': datetime.now().strftime("%Y-%m-%d"),
+            'last_active_date': today,
             'badges': [],
             'total_co2_offset': 0.0,
             'profile_complete': False
         }
 
 
-def add_xp(amount, reason=""):
-    """Add XP and level up if needed"""
-    st.session_state.user_profile['xp'] += amount
+def add_xp(amount, reason="", silent=False):
+    """Add XP and level up if needed (silent skips the balloons, for callers that show their own)"""
+    user = st.session_state.user_profile
+    user['xp'] += amount
 
-    # Level up logic (500 XP per level)
-    xp_for_next_level = st.session_state.user_profile['level'] * 500
-    if st.session_state.user_profile['xp'] >= xp_for_next_level:
-        st.session_state.user_profile['level'] += 1
-        st.balloons()
-        st.success(f"🎉 Level Up! You're now Level {st.session_state.user_profile['level']}")
+    # Level up logic (500 XP per level); a large grant can cross several levels
+    xp = user['xp']
+    level = start_level = user['level']
+    while xp >= _xp_for_next_level(level):
+        level += 1
+
+    if level != start_level:
+        user['level'] = level
+        if not silent:
+            st.balloons()
+        st.success(f"🎉 Level Up! You're now Level {level}")
 
     if reason:
         st.toast(f"+{amount} XP: {reason}", icon="⭐")
 
 
-def award_badge(badge_name, badge_icon, badge_description):
-    """Award a badge to user"""
-    # Check if badge already exists
-    existing_badges = [b['name'] for b in st.session_state.user_profile['badges']]
+def _xp_for_next_level(level):
+    """Total XP at which a user of the given level moves up"""
+    return level * _XP_PER_LEVEL
+
+
+def award_badge(badge_name, badge_icon, badge_description, silent=False):
+    """Award a badge to user (silent skips the balloons); returns True if newly awarded"""
+    badges = st.session_state.user_profile['badges']
 
-    if badge_name not in existing_badges:
-        st.session_state.user_profile['badges'].append({
+    # Check if badge already exists (stops at the first match, no list built)
+    if not any(b['name'] == badge_name for b in badges):
+        badges.append({
             'name': badge_name,
             'icon': badge_icon,
             'description': badge_description,
-            'earned_date': datetime.now().strftime("%Y-%m-%d")
+            'earned_date': date.today().isoformat()
         })
         st.success(f"🏆 New Badge Earned: {badge_icon} {badge_name}")
-        st.balloons()
-        add_xp(50, f"Earned {badge_name} badge!")
+        if not silent:
+            st.balloons()
+        # The badge animation covers a level-up from this XP too
+        add_xp(50, f"Earned {badge_name} badge!", silent=True)
+        return True
+    return False
 
 
 def calculate_green_score():
-    """Calculate total green score from planted trees"""
+    """Calculate total green score from planted trees (recomputed only when they or the date change)"""
+    trees = st.session_state.get('planted_trees', [])
+    today = date.today()
+
+    # Scores depend only on these fields and on today's date (longevity bonus)
+    cache_key = (
+        today,
+        tuple((tree.get('health'), tree.get('status'), tree.get('planted_date')) for tree in trees)
+    )
+    cached = st.session_state.get('green_score_cache')
+    if cached is not None and cached[0] == cache_key:
+        total_score = cached[1]
+    else:
+        total_score = _score_trees(trees, today)
+        st.session_state.green_score_cache = (cache_key, total_score)
+
+    st.session_state.user_profile['green_score'] = total_score
+    return total_score
+
+
+def _score_trees(trees, today):
+    """Sum the green score of each tree as of a given date"""
     total_score = 0
+    health_bonus = _HEALTH_BONUS.get
+    status_bonus = _STATUS_BONUS.get
+    fromisoformat = date.fromisoformat
+
+    for tree in trees:
+        get = tree.get
 
-    for tree in st.session_state.get('planted_trees', []):
         # Base score
         score = 10
 
         # Health bonus
-        health_bonus = {
-            'Excellent': 5,
-            'Good': 3,
-            'Fair': 1,
-            'Needs Attention': 0,
-            'Poor': -2
-        }
-        score += health_bonus.get(tree.get('health', 'Good'), 0)
+        score += health_bonus(get('health', 'Good'), 0)
 
         # Maturity bonus
-        status_bonus = {
-            'Newly Planted': 0,
-            'Seedling': 2,
-            'Sapling': 5,
-            'Young Tree': 10,
-            'Mature Tree': 20
-        }
-        score += status_bonus.get(tree.get('status', 'Newly Planted'), 0)
-
-        # Longevity bonus (planted > 30 days)
-        try:
-            planted_date = datetime.strptime(tree.get('planted_date', datetime.now().strftime("%Y-%m-%d")), "%Y-%m-%d")
-            days_planted = (datetime.now() - planted_date).days
+        score += status_bonus(get('status', 'Newly Planted'), 0)
+
+        # Longevity bonus (planted > 30 days); missing or unreadable dates get no bonus
+        planted = get('planted_date')
+        if planted:
+            try:
+                days_planted = (today - fromisoformat(planted)).days
+            except (ValueError, TypeError):
+                days_planted = 0
             if days_planted > 30:
                 score += 10
             if days_planted > 90:
                 score += 20
-        except:
-            pass
 
         total_score += score
 
-    st.session_state.user_profile['green_score'] = total_score
     return total_score
 
 
 def get_rank_title(level):
     """Get rank title based on level"""
-    ranks = {
-        1: "🌱 Seedling",
-        2: "🌿 Sprout",
-        3: "🪴 Gardener",
-        5: "🌳 Tree Guardian",
-        7: "🌲 Forest Keeper",
-        10: "🏞️ Eco Warrior",
-        15: "🌍 Planet Protector"
-    }
-
-    for min_level in sorted(ranks.keys(), reverse=True):
+    for min_level, title in _RANKS:
         if level >= min_level:
-            return ranks[min_level]
+            return title
     return "🌱 Seedling"
 
 
 def update_streak():
     """Update daily streak"""
-    today = datetime.now().date()
-    last_active = st.session_state.user_profile.get('last_active_date')
+    user = st.session_state.user_profile
+    today = date.today()
+    today_str = today.isoformat()
+    last_active = user.get('last_active_date')
 
+    # Already counted today (every rerun after the first): nothing to parse or update
+    if last_active == today_str:
+        return
+
+    # Days since the last visit (None if unknown or unreadable, which restarts the streak)
+    days_diff = None
     if last_active:
         try:
-            last_date = datetime.strptime(last_active, "%Y-%m-%d").date()
-            days_diff = (today - last_date).days
-
-            if days_diff == 0:
-                # Same day, do nothing
-                pass
-            elif days_diff == 1:
-                # Consecutive day
-                st.session_state.user_profile['streak_days'] += 1
-
-                # Milestone bonuses
-                if st.session_state.user_profile['streak_days'] in [7, 30, 100]:
-                    bonus = st.session_state.user_profile['streak_days'] * 10
-                    add_xp(bonus, f"{st.session_state.user_profile['streak_days']}-day streak!")
-
-                    if st.session_state.user_profile['streak_days'] == 7:
-                        award_badge("Week Warrior", "🔥", "Logged in for 7 consecutive days")
-            else:
-                # Streak broken
-                st.session_state.user_profile['streak_days'] = 1
-        except:
-            st.session_state.user_profile['streak_days'] = 1
-    else:
-        st.session_state.user_profile['streak_days'] = 1
+            days_diff = (today - date.fromisoformat(last_active)).days
+        except (ValueError, TypeError):
+            pass
+
+    if days_diff == 1:
+        # Consecutive day
+        streak = user['streak_days'] + 1
+        user['streak_days'] = streak
+
+        # Milestone bonuses
+        if streak in (7, 30, 100):
+            add_xp(streak * 10, f"{streak}-day streak!")
+
+            if streak == 7:
+                award_badge("Week Warrior", "🔥", "Logged in for 7 consecutive days")
+    elif days_diff != 0:
+        # Streak broken
+        user['streak_days'] = 1
 
-    st.session_state.user_profile['last_active_date'] = today.strftime("%Y-%m-%d")
+    user['last_active_date'] = today_str
+
+
+def _count_plants(trees, excellent_needed, balcony_needed):
+    """
+    Count Excellent-health and balcony plants in a single pass.
+
+    Args:
+        trees (list): Tracked plants
+        excellent_needed (int): Stop counting Excellent plants at this many (0 skips them)
+        balcony_needed (int): Stop counting balcony plants at this many (0 skips them)
+
+    Returns:
+        tuple: (excellent count, balcony count), each capped at its target
+    """
+    excellent = balcony = 0
+    for plant in trees:
+        if excellent < excellent_needed and plant.get('health') == 'Excellent':
+            excellent += 1
+        if balcony < balcony_needed and 'space_required' in plant:
+            balcony += 1
+        if excellent >= excellent_needed and balcony >= balcony_needed:
+            break
+    return excellent, balcony
 
 
 def check_and_award_badges():
     """Check conditions and award badges automatically"""
-    planted_count = len(st.session_state.get('planted_trees', []))
+    user = st.session_state.user_profile
+    trees = st.session_state.get('planted_trees', [])
+    planted_count = len(trees)
+
+    # Badges already earned skip their (possibly O(n)) condition
+    earned = {b['name'] for b in user['badges']}
+    awarded = False
 
     # First Sprout - Plant first tree
-    if planted_count >= 1:
-        award_badge("First Sprout", "🌱", "Planted your first tree!")
+    if 'First Sprout' not in earned and planted_count >= 1:
+        awarded |= award_badge("First Sprout", "🌱", "Planted your first tree!", silent=True)
 
     # Tree Hugger - Track 10 trees
-    if planted_count >= 10:
-        award_badge("Tree Hugger", "🌳", "Tracked 10 trees!")
+    if 'Tree Hugger' not in earned and planted_count >= 10:
+        awarded |= award_badge("Tree Hugger", "🌳", "Tracked 10 trees!", silent=True)
+
+    # One scan serves both plant-count badges (it stops as soon as no more counting is needed)
+    need_excellent = 0 if 'Green Thumb' in earned else 5
+    need_balcony = 0 if 'Balcony Boss' in earned else 5
+    excellent_count, balcony_count = _count_plants(trees, need_excellent, need_balcony)
 
     # Green Thumb - 5 plants with Excellent health
-    excellent_plants = [p for p in st.session_state.get('planted_trees', [])
-                        if p.get('health') == 'Excellent']
-    if len(excellent_plants) >= 5:
-        award_badge("Green Thumb", "💚", "5 plants in excellent health!")
+    if need_excellent and excellent_count >= need_excellent:
+        awarded |= award_badge("Green Thumb", "💚", "5 plants in excellent health!", silent=True)
 
     # Balcony Boss - 5+ balcony plants
-    balcony_plants = [p for p in st.session_state.get('planted_trees', [])
-                      if 'space_required' in p]
-    if len(balcony_plants) >= 5:
-        award_badge("Balcony Boss", "🏙️", "Created a balcony garden!")
+    if need_balcony and balcony_count >= need_balcony:
+        awarded |= award_badge("Balcony Boss", "🏙️", "Created a balcony garden!", silent=True)
 
     # Carbon Hero - Offset 100kg CO2
-    if st.session_state.user_profile.get('total_co2_offset', 0) >= 100:
-        award_badge("Carbon Hero", "🌍", "Offset 100 kg of CO₂!")
+    if 'Carbon Hero' not in earned and user.get('total_co2_offset', 0) >= 100:
+        awarded |= award_badge("Carbon Hero", "🌍", "Offset 100 kg of CO₂!", silent=True)
 
     # Rising Star - Reach Level 3
-    if st.session_state.user_profile['level'] >= 3:
-        award_badge("Rising Star", "⭐", "Reached Level 3!")
+    if 'Rising Star' not in earned and user['level'] >= 3:
+        awarded |= award_badge("Rising Star", "⭐", "Reached Level 3!", silent=True)
+
+    # One animation however many badges were earned on this rerun
+    if awarded:
+        st.balloons()
 
 
 def display_profile_sidebar():
@@ -200,10 +284,10 @@ def display_profile_sidebar():
         if st.session_state.get('editing_name', False):
             new_name = st.text_input("Username:", value=user['username'], key="username_input")
             if st.button("Save", key="save_name_btn"):
-                st.session_state.user_profile['username'] = new_name
+                user['username'] = new_name
                 st.session_state.editing_name = False
                 if not user['profile_complete']:
-                    st.session_state.user_profile['profile_complete'] = True
+                    user['profile_complete'] = True
                     add_xp(25, "Completed profile!")
                 st.rerun()
         else:
@@ -223,7 +307,7 @@ def display_profile_sidebar():
             st.metric("Green Score", green_score)
 
         # Progress bar to next level
-        xp_for_next = user['level'] * 500
+        xp_for_next = _xp_for_next_level(user['level'])
         progress = min(user['xp'] / xp_for_next if xp_for_next > 0 else 1.0, 1.0)
         st.progress(progress)
         st.caption(f"{user['xp']} / {xp_for_next} XP to Level {user['level'] + 1}")